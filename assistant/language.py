@@ -2,10 +2,10 @@
 
 # German-specific characters and common function words for language detection.
 # More reliable than langdetect for short text and our EN/DE use case.
-_DE_CHARS = set("äöüßÄÖÜ")
+_DE_CHARS = frozenset("äöüßÄÖÜ")
 # Words that are unambiguously German (never standalone English words).
 # A single match is enough to identify German.
-_DE_STRONG = {
+_DE_STRONG = frozenset({
     "ich", "und", "der", "das", "ist", "ein", "eine", "nicht", "auf",
     "mit", "den", "dem", "sich", "von", "für", "aber", "wenn",
     "nur", "noch", "nach", "auch", "schon", "dann", "kann", "wir",
@@ -13,7 +13,10 @@ _DE_STRONG = {
     "habe", "dir", "sehr", "hier", "diese", "dieser",
     "geht", "gibt", "bitte", "gerne", "danke", "jetzt", "kein",
     "keine", "mein", "meine", "dein", "immer", "dort", "denn", "weil",
-}
+})
+_WORD_PUNCTUATION = ".,!?;:\"'()[]"
+# Languages we have TTS voices for; anything else falls back to English.
+_SUPPORTED_LANGUAGES = frozenset({"en", "de"})
 
 
 def detect_response_language(text: str, fallback: str = "en") -> str:
@@ -22,12 +25,12 @@ def detect_response_language(text: str, fallback: str = "en") -> str:
     Uses German orthographic markers and common function words.
     Returns *fallback* when no German markers are found.
     """
-    if any(c in _DE_CHARS for c in text):
+    # isdisjoint() runs in C and stops at the first hit.
+    if not _DE_CHARS.isdisjoint(text):
         return "de"
 
-    words = {w.strip(".,!?;:\"'()[]") for w in text.lower().split()}
-    if words & _DE_STRONG:
+    if not _DE_STRONG.isdisjoint(w.strip(_WORD_PUNCTUATION) for w in text.lower().split()):
         return "de"
 
     normalized_fallback = (fallback or "en").lower()
-    return normalized_fallback if normalized_fallback in {"en", "de"} else "en"
+    return normalized_fallback if normalized_fallback in _SUPPORTED_LANGUAGES else "en"
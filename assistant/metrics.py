@@ -1,10 +1,28 @@
 """JSONL event logger for interaction metrics."""
 
 import json
+import os
 import threading
 import time
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional speedup — stdlib json is the fallback.
+    orjson = None
+
+
+def _to_float(obj) -> float:
+    """Serialize numpy scalars and other number-likes as plain floats."""
+    return float(obj)
+
+
+def _dumps(entry: dict) -> bytes:
+    """Serialize one event to a UTF-8 JSON line body (without newline)."""
+    if orjson is not None:
+        return orjson.dumps(entry, default=_to_float)
+    return json.dumps(entry, default=_to_float).encode("utf-8")
+
 
 class MetricsLogger:
     """Thread-safe JSONL logger with periodic flushing."""
@@ -18,8 +36,11 @@ class MetricsLogger:
             flush_interval = 10
         self._flush_interval = max(1, flush_interval)
 
-        self._buffer: list[str] = []
+        self._buffer: list[bytes] = []
         self._lock = threading.Lock()
+        # Opened on first flush and kept open; dropped after a write error or
+        # when the path was rotated/deleted so the next flush reopens it.
+        self._file = None
         self._event_count = 0
         self._write_error_count = 0
         self._last_warn_s = 0.0
@@ -43,7 +64,7 @@ class MetricsLogger:
             **data,
         }
         try:
-            line = json.dumps(entry, default=lambda o: float(o))
+            line = _dumps(entry)
         except (TypeError, ValueError, OverflowError):
             self._warn_write_error("metrics serialization failed; dropping event")
             return
@@ -59,13 +80,22 @@ class MetricsLogger:
         with self._lock:
             self._flush_locked_safe()
 
+    def close(self) -> None:
+        """Flush buffered events and release the metrics file handle."""
+        with self._lock:
+            self._flush_locked_safe()
+            self._close_file_locked()
+
     def _flush_locked(self) -> None:
         """Internal flush — must be called with lock held."""
         if not self._buffer:
             return
-        with open(self._file_path, "a") as f:
-            for line in self._buffer:
-                f.write(line + "\n")
+        if self._file is not None and self._file_replaced_locked():
+            self._close_file_locked()
+        if self._file is None:
+            self._file = open(self._file_path, "ab")
+        self._file.write(b"\n".join(self._buffer) + b"\n")
+        self._file.flush()
         self._buffer.clear()
 
     def _flush_locked_safe(self) -> None:
@@ -75,9 +105,28 @@ class MetricsLogger:
         except (OSError, ValueError):
             # Drop buffered events to avoid unbounded memory growth.
             self._buffer.clear()
+            self._close_file_locked()
             self._write_error_count += 1
             self._warn_write_error("metrics flush failed; dropping buffered events")
 
+    def _file_replaced_locked(self) -> bool:
+        """True if the log path no longer refers to the open file (rotated/deleted)."""
+        try:
+            path_stat = os.stat(self._file_path)
+        except FileNotFoundError:
+            return True
+        file_stat = os.fstat(self._file.fileno())
+        return (path_stat.st_dev, path_stat.st_ino) != (file_stat.st_dev, file_stat.st_ino)
+
+    def _close_file_locked(self) -> None:
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+        except (OSError, ValueError):
+            pass
+        self._file = None
+
     def _warn_write_error(self, message: str) -> None:
         now = time.monotonic()
         if now - self._last_warn_s < self._warn_interval_s:
@@ -145,7 +145,8 @@ class StateMachine:
         self._listening_hard_start = 0.0  # Never reset — absolute cap
 
         # Frame buffer for capturing speech onset before transition to LISTENING
-        # 25 frames × 80ms = 2s of audio context
+        # 25 frames × 80ms = 2s of audio context. Capture frames are freshly
+        # allocated per block and never mutated, so they are kept by reference.
         self._recent_frames: list[tuple[np.ndarray, bool]] = []
         self._recent_frames_max = 25
 
@@ -416,7 +417,7 @@ class StateMachine:
 
         # Buffer recent frames so speech onset isn't lost on barge-in
         is_speech = self._vad.is_speech(frame)
-        self._recent_frames.append((frame.copy(), is_speech))
+        self._recent_frames.append((frame, is_speech))
         if len(self._recent_frames) > self._recent_frames_max:
             self._recent_frames.pop(0)
 
@@ -445,7 +446,7 @@ class StateMachine:
 
         # Always buffer frames so speech during grace period isn't lost
         is_speech = self._vad.is_speech(frame)
-        self._recent_frames.append((frame.copy(), is_speech))
+        self._recent_frames.append((frame, is_speech))
         if len(self._recent_frames) > self._recent_frames_max:
             self._recent_frames.pop(0)
 
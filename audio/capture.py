@@ -34,7 +34,9 @@ class AudioCapture:
             pass  # Silently ignore xruns to avoid log spam
         # indata shape: (frames, channels), dtype float32
         mono = indata[:, 0] if indata.shape[1] > 1 else indata.ravel()
-        int16_data = (mono * 32767).astype(np.int16)
+        # Scale and cast in one pass, without a float32 temporary.
+        int16_data = np.empty(len(mono), dtype=np.int16)
+        np.multiply(mono, 32767, out=int16_data, casting="unsafe")
         self.ring_buffer.write(int16_data)
         try:
             self.frame_queue.put_nowait(int16_data)
@@ -60,7 +62,11 @@ class AudioCapture:
             self._stream = None
 
     def get_frame(self, timeout: float = 0.2) -> np.ndarray | None:
-        """Get the next audio frame from the queue. Returns None on timeout."""
+        """Get the next audio frame from the queue. Returns None on timeout.
+
+        Each frame is a new array that nothing else writes to, so consumers
+        may keep references to it without copying.
+        """
         try:
             return self.frame_queue.get(timeout=timeout)
         except queue.Empty:
@@ -1,17 +1,29 @@
 """Short notification sounds (earcons) for state transitions."""
 
+import functools
+
 import numpy as np
 
 from audio.playback import AudioPlayer
 
 
+def _freeze(audio: np.ndarray) -> np.ndarray:
+    """Mark a cached earcon buffer read-only so callers can't corrupt it."""
+    audio.setflags(write=False)
+    return audio
+
+
+@functools.lru_cache(maxsize=32)
 def generate_tone(
     frequency: float = 880,
     duration_s: float = 0.15,
     volume: float = 0.3,
     sample_rate: int = 16000,
 ) -> np.ndarray:
-    """Generate a sine-wave tone with a smooth fade-in/fade-out envelope."""
+    """Generate a sine-wave tone with a smooth fade-in/fade-out envelope.
+
+    Results are cached and returned read-only.
+    """
     t = np.linspace(0, duration_s, int(sample_rate * duration_s), endpoint=False)
     tone = np.sin(2 * np.pi * frequency * t)
 
@@ -22,11 +34,12 @@ def generate_tone(
         envelope[:fade_len] = np.linspace(0, 1, fade_len)
         envelope[-fade_len:] = np.linspace(1, 0, fade_len)
 
-    return (tone * envelope * volume).astype(np.float32)
+    return _freeze((tone * envelope * volume).astype(np.float32))
 
 
+@functools.lru_cache(maxsize=32)
 def generate_earcon(name: str, sample_rate: int = 16000, volume: float = 0.3) -> np.ndarray:
-    """Generate a named earcon.
+    """Generate a named earcon (cached, returned read-only).
 
     Supported names:
         wake       – rising chime on wake word detection (A5, 150ms)
@@ -45,7 +58,7 @@ def generate_earcon(name: str, sample_rate: int = 16000, volume: float = 0.3) ->
         pip1 = generate_tone(660, 0.08, volume, sample_rate)
         gap = np.zeros(int(sample_rate * 0.04), dtype=np.float32)
         pip2 = generate_tone(880, 0.08, volume, sample_rate)
-        return np.concatenate([pip1, gap, pip2])
+        return _freeze(np.concatenate([pip1, gap, pip2]))
 
     if name == "goodbye":
         t = np.linspace(0, 0.20, int(sample_rate * 0.20), endpoint=False)
@@ -56,13 +69,13 @@ def generate_earcon(name: str, sample_rate: int = 16000, volume: float = 0.3) ->
         if fade_len > 0 and fade_len * 2 < len(t):
             envelope[:fade_len] = np.linspace(0, 1, fade_len)
             envelope[-fade_len:] = np.linspace(1, 0, fade_len)
-        return (tone * envelope * volume).astype(np.float32)
+        return _freeze((tone * envelope * volume).astype(np.float32))
 
     if name == "error":
         buzz1 = generate_tone(220, 0.08, volume, sample_rate)
         gap = np.zeros(int(sample_rate * 0.06), dtype=np.float32)
         buzz2 = generate_tone(220, 0.08, volume, sample_rate)
-        return np.concatenate([buzz1, gap, buzz2])
+        return _freeze(np.concatenate([buzz1, gap, buzz2]))
 
     raise ValueError(f"Unknown earcon: {name!r}")
 
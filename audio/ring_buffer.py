@@ -13,7 +13,8 @@ class RingBuffer:
 
     def __init__(self, max_seconds: float, sample_rate: int = 16000):
         self._capacity = int(max_seconds * sample_rate)
-        self._buf = np.zeros(self._capacity, dtype=np.int16)
+        # Uninitialized is fine: read_last() never returns more than was written.
+        self._buf = np.empty(self._capacity, dtype=np.int16)
         self._write_pos = 0
         self._total_written = 0
         self._lock = threading.Lock()
@@ -63,6 +64,5 @@ class RingBuffer:
 
     def clear(self) -> None:
         with self._lock:
-            self._buf[:] = 0
             self._write_pos = 0
             self._total_written = 0
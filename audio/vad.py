@@ -30,7 +30,8 @@ class VoiceActivityDetector:
         if rms < self._energy_threshold:
             return False
 
-        audio_bytes = frame_int16.tobytes()
+        # Byte view over the frame — slicing it below does not copy.
+        audio_bytes = memoryview(np.ascontiguousarray(frame_int16, dtype=np.int16)).cast("B")
         chunk_bytes = self._frame_size * 2  # int16 = 2 bytes per sample
 
         for offset in range(0, len(audio_bytes), chunk_bytes):
@@ -76,7 +77,12 @@ class UtteranceDetector:
         self._pre_buffer.clear()
 
     def process(self, frame_int16: np.ndarray, is_speech: bool) -> str:
-        """Feed a frame and return the current state."""
+        """Feed a frame and return the current state.
+
+        Frames are retained by reference, not copied: callers must not reuse
+        or mutate a frame after passing it in (``AudioCapture`` allocates a
+        fresh array per block).
+        """
         now = time.monotonic()
 
         if self._state == "complete":
@@ -84,7 +90,7 @@ class UtteranceDetector:
 
         if self._state == "waiting":
             # Keep a rolling pre-buffer so we capture audio before onset
-            self._pre_buffer.append(frame_int16.copy())
+            self._pre_buffer.append(frame_int16)
             if len(self._pre_buffer) > self._pre_buffer_size:
                 self._pre_buffer.pop(0)
 
@@ -99,12 +105,12 @@ class UtteranceDetector:
                 self._pre_buffer.clear()
 
             elif self._state == "collecting":
-                self._audio_chunks.append(frame_int16.copy())
+                self._audio_chunks.append(frame_int16)
         else:
             self._consecutive_speech = 0
 
             if self._state == "collecting":
-                self._audio_chunks.append(frame_int16.copy())
+                self._audio_chunks.append(frame_int16)
                 if now - self._last_speech_time >= self._silence_timeout_s:
                     self._state = "complete"
 
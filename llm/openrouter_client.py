@@ -8,6 +8,12 @@ import random
 
 import requests
 
+# Transient statuses worth another attempt: request timeouts and rate limits,
+# plus any 5xx (including 52x gateway errors) except the two that can never
+# succeed on retry. Everything else (auth, bad request) is final.
+_RETRYABLE_4XX = frozenset({408, 429})
+_PERMANENT_5XX = frozenset({501, 505})  # Not Implemented, HTTP Version Not Supported
+
 
 class OpenRouterClient:
     """Streaming HTTP client for OpenRouter's chat completions API."""
@@ -35,13 +41,15 @@ class OpenRouterClient:
         if not self._api_key:
             print("\033[31mWARNING: OPENROUTER_API_KEY not set\033[0m")
 
-    def _headers(self) -> dict:
-        return {
+        # Headers are constant for the client's lifetime; requests merges them
+        # into its own mapping, so one dict is safely reused for every call.
+        self._headers = {
             "Authorization": f"Bearer {self._api_key}",
             "Content-Type": "application/json",
             "HTTP-Referer": "https://github.com/leonardo-assistant",
             "X-Title": "Jarvis Voice Assistant",
         }
+        self._url = f"{self._api_base}/chat/completions"
 
     def warmup(self) -> None:
         """Fire-and-forget minimal request to warm up the API connection.
@@ -61,8 +69,8 @@ class OpenRouterClient:
                     "stream": True,
                 }
                 resp = requests.post(
-                    f"{self._api_base}/chat/completions",
-                    headers=self._headers(),
+                    self._url,
+                    headers=self._headers,
                     json=payload,
                     stream=True,
                     timeout=10,
@@ -91,6 +99,8 @@ class OpenRouterClient:
 
         t0 = time.monotonic()
         attempts = self._max_retries + 1
+        # Overall budget for all attempts; backoff never sleeps past it.
+        deadline = t0 + self._timeout * attempts
         last_error: Exception | None = None
 
         for attempt in range(attempts):
@@ -101,29 +111,33 @@ class OpenRouterClient:
 
             try:
                 resp = requests.post(
-                    f"{self._api_base}/chat/completions",
-                    headers=self._headers(),
+                    self._url,
+                    headers=self._headers,
                     json=payload,
                     stream=True,
                     timeout=self._timeout,
                 )
                 if resp.status_code >= 400:
                     should_retry = self._should_retry_status(resp.status_code)
-                    if should_retry and attempt < attempts - 1:
-                        self._sleep_before_retry(attempt)
+                    if (
+                        should_retry
+                        and attempt < attempts - 1
+                        and self._sleep_before_retry(attempt, deadline)
+                    ):
                         continue
                     resp.raise_for_status()
 
-                resp.encoding = "utf-8"
-                for line in resp.iter_lines(decode_unicode=True):
-                    if not line or not line.startswith("data: "):
+                # Work on raw bytes: json.loads decodes UTF-8 itself, so only
+                # the payloads we actually parse are ever decoded.
+                for line in resp.iter_lines():
+                    if not line or not line.startswith(b"data: "):
                         continue
-                    data_str = line[6:]  # Strip "data: " prefix
-                    if data_str.strip() == "[DONE]":
+                    data_bytes = line[6:]  # Strip "data: " prefix
+                    if data_bytes.strip() == b"[DONE]":
                         break
                     try:
-                        data = json.loads(data_str)
-                    except json.JSONDecodeError:
+                        data = json.loads(data_bytes)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
                         continue
 
                     if "model" in data:
@@ -156,7 +170,8 @@ class OpenRouterClient:
                     retryable = bool(status and self._should_retry_status(status))
                 if (not retryable) or (attempt >= attempts - 1):
                     raise
-                self._sleep_before_retry(attempt)
+                if not self._sleep_before_retry(attempt, deadline):
+                    raise
             finally:
                 if resp is not None:
                     resp.close()
@@ -167,10 +182,20 @@ class OpenRouterClient:
 
     def _should_retry_status(self, status_code: int) -> bool:
         """Retry transient HTTP statuses only."""
-        return status_code == 429 or status_code >= 500
+        if status_code >= 500:
+            return status_code not in _PERMANENT_5XX
+        return status_code in _RETRYABLE_4XX
 
-    def _sleep_before_retry(self, attempt: int) -> None:
-        """Exponential backoff with a small jitter."""
+    def _sleep_before_retry(self, attempt: int, deadline: float) -> bool:
+        """Exponential backoff with a small jitter, bounded by *deadline*.
+
+        Returns False without sleeping when the backoff would reach the
+        deadline, in which case the caller gives up instead of retrying.
+        """
+        remaining = deadline - time.monotonic()
         base = self._retry_base_delay_s * (2 ** attempt)
-        jitter = random.uniform(0.0, base * 0.25)
-        time.sleep(base + jitter)
+        delay = base + random.uniform(0.0, base * 0.25)
+        if delay >= remaining:
+            return False
+        time.sleep(delay)
+        return True
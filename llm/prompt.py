@@ -22,15 +22,7 @@ _LANGUAGE_NAMES: dict[str, str] = {
 DEFAULT_SYSTEM_PROMPT = _BASE_SYSTEM_PROMPT
 
 
-def get_system_prompt(language: str | None = None) -> str:
-    """Return the system prompt, optionally tailored to *language*.
-
-    When *language* is ``None`` or ``"en"``, the base English prompt is returned.
-    For other languages the LLM is instructed to respond in that language.
-    """
-    if not language or language == "en":
-        return _BASE_SYSTEM_PROMPT
-
+def _build_system_prompt(language: str) -> str:
     lang_name = _LANGUAGE_NAMES.get(language, language)
     return (
         f"{_BASE_SYSTEM_PROMPT} "
@@ -40,31 +32,78 @@ def get_system_prompt(language: str | None = None) -> str:
     )
 
 
-def clean_for_tts(text: str) -> str:
-    """Strip citations, URLs, markdown, and other non-speakable artifacts."""
+# Prompts for the known languages, built once; other Whisper-detected
+# languages are formatted on demand.
+_SYSTEM_PROMPTS: dict[str, str] = {
+    lang: _BASE_SYSTEM_PROMPT if lang == "en" else _build_system_prompt(lang)
+    for lang in _LANGUAGE_NAMES
+}
+
+
+def get_system_prompt(language: str | None = None) -> str:
+    """Return the system prompt, optionally tailored to *language*.
+
+    When *language* is ``None`` or ``"en"``, the base English prompt is returned.
+    For other languages the LLM is instructed to respond in that language.
+    """
+    if not language:
+        return _BASE_SYSTEM_PROMPT
+    prompt = _SYSTEM_PROMPTS.get(language)
+    return prompt if prompt is not None else _build_system_prompt(language)
+
+
+# Substitutions applied in order by clean_for_tts(), compiled once at import.
+_CLEAN_SUBSTITUTIONS: tuple[tuple[re.Pattern[str], str], ...] = (
     # Remove assistant citation control tokens used by some providers.
-    text = re.sub(r'\uE200.*?\uE201', '', text, flags=re.DOTALL)
+    (re.compile(r'\uE200.*?\uE201', re.DOTALL), ''),
     # Remove CJK-style citation brackets like 【1†source】 / 〖2〗
-    text = re.sub(r'[\u3010\u3016][^\u3011\u3017]+[\u3011\u3017]', '', text)
+    (re.compile(r'[\u3010\u3016][^\u3011\u3017]+[\u3011\u3017]'), ''),
     # Remove markdown links [text](url) → text
-    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
+    (re.compile(r'\[([^\]]+)\]\([^)]+\)'), r'\1'),
     # Remove bare URLs
-    text = re.sub(r'https?://\S+', '', text)
+    (re.compile(r'https?://\S+'), ''),
     # Remove citation markers like [1], [2, 3], [source], etc.
-    text = re.sub(r'\[\d+(?:[,\s]*\d+)*\]', '', text)
-    text = re.sub(r'\[(?:source|citation|ref)\w*\]', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\[(?:source|sources|citation|citations|ref\w*|quelle|quellen)[^\]]*\]', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\[\^(?:\d+|source|ref\w*)\]', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\((?:source|sources|citation|citations|reference|references|quelle|quellen)\s*:[^)]+\)', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'(?im)^\s*(?:sources?|references?|citations?|quellen?)\s*:\s*$', '', text)
+    (re.compile(r'\[\d+(?:[,\s]*\d+)*\]'), ''),
+    (re.compile(r'\[(?:source|citation|ref)\w*\]', re.IGNORECASE), ''),
+    (re.compile(r'\[(?:source|sources|citation|citations|ref\w*|quelle|quellen)[^\]]*\]', re.IGNORECASE), ''),
+    (re.compile(r'\[\^(?:\d+|source|ref\w*)\]', re.IGNORECASE), ''),
+    (re.compile(r'\((?:source|sources|citation|citations|reference|references|quelle|quellen)\s*:[^)]+\)', re.IGNORECASE), ''),
+    (re.compile(r'(?im)^\s*(?:sources?|references?|citations?|quellen?)\s*:\s*$'), ''),
     # Remove footnote-style markers like ¹ ² ³
-    text = re.sub(r'[¹²³⁴⁵⁶⁷⁸⁹⁰]+', '', text)
+    (re.compile(r'[¹²³⁴⁵⁶⁷⁸⁹⁰]+'), ''),
     # Remove markdown bold/italic markers
-    text = re.sub(r'\*{1,3}([^*]+)\*{1,3}', r'\1', text)
+    (re.compile(r'\*{1,3}([^*]+)\*{1,3}'), r'\1'),
     # Remove markdown headers
-    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+    (re.compile(r'^#{1,6}\s+', re.MULTILINE), ''),
     # Remove bullet point markers
-    text = re.sub(r'^\s*[-*•]\s+', '', text, flags=re.MULTILINE)
+    (re.compile(r'^\s*[-*•]\s+', re.MULTILINE), ''),
+)
+
+# Lines that consist only of a reference heading, marker, or link.
+_REFERENCE_LINE_RES: tuple[re.Pattern[str], ...] = (
+    re.compile(r'(?i)^(?:sources?|references?|citations?|quellen?)\s*:?\s*$'),
+    re.compile(r'^(?:\[\d+\]|\d+[.)])\s*$'),
+    re.compile(r'(?i)^(?:\[\d+\]|\d+[.)])\s*(?:https?://\S+|www\.\S+)\s*$'),
+    re.compile(r'(?i)^(?:https?://\S+|www\.\S+)\s*$'),
+)
+
+# Whitespace/punctuation normalization applied last.
+_COLLAPSE_SUBSTITUTIONS: tuple[tuple[re.Pattern[str], str], ...] = (
+    (re.compile(r'[ \t]+\n'), '\n'),
+    (re.compile(r'\n{2,}'), '. '),
+    (re.compile(r'\n'), ' '),
+    (re.compile(r'  +'), ' '),
+    (re.compile(r'\s+([,.;:!?])'), r'\1'),
+    (re.compile(r'([,.;:!?]){2,}'), r'\1'),
+)
+
+
+def clean_for_tts(text: str) -> str:
+    """Strip citations, URLs, markdown, and other non-speakable artifacts."""
+    if not text:
+        return ""
+    for pattern, replacement in _CLEAN_SUBSTITUTIONS:
+        text = pattern.sub(replacement, text)
     # Drop lines that are only references/citations.
     kept_lines: list[str] = []
     for line in text.splitlines():
@@ -72,23 +111,13 @@ def clean_for_tts(text: str) -> str:
         if not stripped:
             kept_lines.append(line)
             continue
-        if re.match(r'(?i)^(?:sources?|references?|citations?|quellen?)\s*:?\s*$', stripped):
-            continue
-        if re.match(r'^(?:\[\d+\]|\d+[.)])\s*$', stripped):
-            continue
-        if re.match(r'(?i)^(?:\[\d+\]|\d+[.)])\s*(?:https?://\S+|www\.\S+)\s*$', stripped):
-            continue
-        if re.match(r'(?i)^(?:https?://\S+|www\.\S+)\s*$', stripped):
+        if any(pattern.match(stripped) for pattern in _REFERENCE_LINE_RES):
             continue
         kept_lines.append(line)
     text = "\n".join(kept_lines)
     # Collapse multiple spaces/newlines
-    text = re.sub(r'[ \t]+\n', '\n', text)
-    text = re.sub(r'\n{2,}', '. ', text)
-    text = re.sub(r'\n', ' ', text)
-    text = re.sub(r'  +', ' ', text)
-    text = re.sub(r'\s+([,.;:!?])', r'\1', text)
-    text = re.sub(r'([,.;:!?]){2,}', r'\1', text)
+    for pattern, replacement in _COLLAPSE_SUBSTITUTIONS:
+        text = pattern.sub(replacement, text)
     return text.strip()
 
 
@@ -69,7 +69,7 @@ def main():
         machine.run()
     finally:
         capture.stop()
-        metrics.flush()
+        metrics.close()
         print("\033[32mGoodbye.\033[0m")
 
 
@@ -6,7 +6,7 @@ from faster_whisper import WhisperModel
 
 
 class WhisperSTT:
-    """Loads a Whisper model once and transcribes int16 audio buffers."""
+    """Loads a Whisper model once and transcribes int16 audio buffers or PCM bytes."""
 
     def __init__(self, stt_config: dict):
         self._model = WhisperModel(
@@ -16,13 +16,22 @@ class WhisperSTT:
         )
         self._language = stt_config.get("language")
 
-    def transcribe(self, audio_int16: np.ndarray, sample_rate: int = 16000) -> dict:
-        """Transcribe an int16 audio buffer.
+    def transcribe(
+        self, audio: np.ndarray | bytes | bytearray | memoryview, sample_rate: int = 16000
+    ) -> dict:
+        """Transcribe int16 audio given as an array or raw little-endian PCM bytes.
 
         Returns dict with keys: text, language, duration_s, transcription_time_s
         """
-        # faster-whisper expects float32 normalized to [-1, 1]
-        audio_f32 = audio_int16.astype(np.float32) / 32768.0
+        if isinstance(audio, (bytes, bytearray, memoryview)):
+            # A trailing odd byte is an incomplete sample; drop it rather than
+            # letting frombuffer reject the whole buffer.
+            audio = np.frombuffer(audio, dtype=np.int16, count=memoryview(audio).nbytes // 2)
+
+        # faster-whisper expects float32 normalized to [-1, 1]; scale in a single
+        # pass straight into the output buffer instead of astype() + divide.
+        audio_f32 = np.empty(len(audio), dtype=np.float32)
+        np.multiply(audio, np.float32(1 / 32768.0), out=audio_f32)
         duration_s = len(audio_f32) / sample_rate
 
         t0 = time.monotonic()
@@ -0,0 +1,50 @@
+import importlib
+import sys
+import types
+
+import pytest
+
+
+def _module(name: str, **attrs):
+    mod = types.ModuleType(name)
+    for key, value in attrs.items():
+        setattr(mod, key, value)
+    return mod
+
+
+def _state_machine_stubs() -> dict[str, types.ModuleType]:
+    """Stand-ins for the hardware/model modules imported by the state machine."""
+    return {
+        "audio.capture": _module("audio.capture", AudioCapture=object),
+        "audio.playback": _module("audio.playback", AudioPlayer=object),
+        "audio.vad": _module("audio.vad", VoiceActivityDetector=object, UtteranceDetector=object),
+        "audio.earcon": _module(
+            "audio.earcon", play_earcon=lambda *a, **k: None, play_named_earcon=lambda *a, **k: None,
+        ),
+        "wake.detector": _module("wake.detector", WakeWordDetector=object),
+        "stt.whisper_stt": _module("stt.whisper_stt", WhisperSTT=object),
+        "llm.openrouter_client": _module("llm.openrouter_client", OpenRouterClient=object),
+        "tts": _module("tts", TTSEngine=object),
+    }
+
+
+@pytest.fixture(scope="session")
+def sm():
+    """``assistant.state_machine`` imported once against stubbed hardware/model deps.
+
+    The stubs are only installed for the duration of the import; the returned
+    module keeps its references to them, while the rest of the session sees the
+    real ``sys.modules`` again.
+    """
+    stubs = _state_machine_stubs()
+    names = [*stubs, "assistant.state_machine"]
+    saved = {name: sys.modules[name] for name in names if name in sys.modules}
+
+    sys.modules.pop("assistant.state_machine", None)
+    sys.modules.update(stubs)
+    try:
+        return importlib.import_module("assistant.state_machine")
+    finally:
+        for name in names:
+            sys.modules.pop(name, None)
+        sys.modules.update(saved)
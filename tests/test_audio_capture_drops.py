@@ -29,6 +29,9 @@ def test_dropped_frames_counter_increments_and_resets(monkeypatch) -> None:
         capture._callback(indata, 1280, None, None)
 
     assert capture.dropped_frames > 0
+    first = capture.frame_queue.get_nowait()
+    assert first.dtype == np.int16
+    assert (first == 32767).all()
     dropped = capture.consume_dropped_frames()
     assert dropped > 0
     assert capture.dropped_frames == 0
@@ -0,0 +1,48 @@
+import importlib
+import sys
+import threading
+import types
+
+import numpy as np
+
+# 10ms of silence at 16 kHz; playback only forwards it to the (fake) device.
+_CLIP = np.zeros(160, dtype=np.float32)
+_CLIP.setflags(write=False)
+
+
+def _load_playback_with_fake_sounddevice(monkeypatch):
+    finished = threading.Event()
+    fake_sd = types.SimpleNamespace(
+        play=lambda audio, samplerate=None: finished.clear(),
+        wait=finished.wait,
+        stop=finished.set,
+    )
+    monkeypatch.setitem(sys.modules, "sounddevice", fake_sd)
+    sys.modules.pop("audio.playback", None)
+    return importlib.import_module("audio.playback"), finished
+
+
+def test_wait_until_done_blocks_until_playback_ends(monkeypatch) -> None:
+    playback_mod, finished = _load_playback_with_fake_sounddevice(monkeypatch)
+    player = playback_mod.AudioPlayer(16000)
+
+    assert player.wait_until_done(timeout=0) is True
+
+    player.play(_CLIP)
+    assert player.is_playing
+    assert player.wait_until_done(timeout=0.01) is False
+
+    finished.set()  # Device drained
+    assert player.wait_until_done(timeout=1.0) is True
+    assert not player.is_playing
+
+
+def test_stop_releases_waiters(monkeypatch) -> None:
+    playback_mod, _ = _load_playback_with_fake_sounddevice(monkeypatch)
+    player = playback_mod.AudioPlayer(16000)
+
+    player.play(_CLIP)
+    player.stop()
+
+    assert player.wait_until_done(timeout=0) is True
+    assert not player.is_playing
@@ -0,0 +1,15 @@
+import pytest
+
+from tts.mac_say import MacTTS
+
+
+def test_missing_default_say_voice_names_the_config_key() -> None:
+    config = {
+        "rate": 190,
+        "default_language": "en",
+        "voices": {"en": {"piper_voice": "en-voice"}, "de": {"say_voice": "Anna"}},
+    }
+
+    with pytest.raises(ValueError, match=r"tts\.voices\.en\.say_voice"):
+        MacTTS(config)
+
@@ -1,5 +1,9 @@
+import json
 from pathlib import Path
 
+import numpy as np
+import pytest
+
 from assistant.metrics import MetricsLogger
 
 
@@ -37,3 +41,67 @@ def test_serialization_failure_drops_event_without_crashing(tmp_path: Path) -> N
     path = tmp_path / "metrics.jsonl"
     if path.exists():
         assert path.read_text().strip() == ""
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_numpy_scalars_and_unicode_round_trip(monkeypatch, tmp_path: Path, use_orjson: bool) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr("assistant.metrics.orjson", None)
+    log_path = tmp_path / "metrics.jsonl"
+    logger = MetricsLogger({"enabled": True, "file": str(log_path), "flush_interval": 10})
+
+    logger.log("event_a", score=np.float32(0.5), text="Grüße")
+    logger.log("event_b", value=2)
+    logger.flush()
+
+    events = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    assert [e["event"] for e in events] == ["event_a", "event_b"]
+    assert events[0]["score"] == 0.5
+    assert events[0]["text"] == "Grüße"
+
+
+def test_file_is_opened_once_and_reopened_after_failure(monkeypatch, tmp_path: Path) -> None:
+    log_path = tmp_path / "metrics.jsonl"
+    logger = MetricsLogger({"enabled": True, "file": str(log_path), "flush_interval": 1})
+    real_open = open
+    opens = {"n": 0}
+
+    def _counting_open(*args, **kwargs):
+        opens["n"] += 1
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", _counting_open)
+
+    logger.log("event_a")
+    logger.log("event_b")
+    assert opens["n"] == 1
+
+    logger._file.close()  # Simulate the handle going bad (write raises ValueError)
+    logger.log("event_lost")
+    logger.log("event_c")
+    logger.close()
+
+    assert opens["n"] == 2
+    events = [json.loads(line)["event"] for line in log_path.read_text().splitlines()]
+    assert events == ["event_a", "event_b", "event_c"]
+
+
+@pytest.mark.parametrize("rotate", ["rename", "delete"])
+def test_reopens_file_after_external_rotation(tmp_path: Path, rotate: str) -> None:
+    log_path = tmp_path / "metrics.jsonl"
+    logger = MetricsLogger({"enabled": True, "file": str(log_path), "flush_interval": 1})
+
+    logger.log("event_a")
+    if rotate == "rename":
+        log_path.rename(tmp_path / "metrics.jsonl.1")
+    else:
+        log_path.unlink()
+    logger.log("event_b")
+    logger.close()
+
+    assert [json.loads(line)["event"] for line in log_path.read_text().splitlines()] == ["event_b"]
+    if rotate == "rename":
+        rotated = (tmp_path / "metrics.jsonl.1").read_text().splitlines()
+        assert [json.loads(line)["event"] for line in rotated] == ["event_a"]
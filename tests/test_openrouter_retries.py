@@ -7,15 +7,15 @@ from llm.openrouter_client import OpenRouterClient
 
 
 class FakeResponse:
-    def __init__(self, status_code: int, lines: list[str] | None = None):
+    def __init__(self, status_code: int, lines: list[bytes] | None = None):
         self.status_code = status_code
         self._lines = lines or []
         self.encoding = None
         self.closed = False
 
-    def iter_lines(self, decode_unicode: bool = True):
+    def iter_lines(self, decode_unicode: bool = False):
         for line in self._lines:
-            yield line
+            yield line.decode("utf-8") if decode_unicode else line
 
     def raise_for_status(self) -> None:
         if self.status_code >= 400:
@@ -47,8 +47,8 @@ def test_retries_on_timeout_then_succeeds(monkeypatch) -> None:
     calls = {"n": 0}
 
     success_lines = [
-        'data: {"model":"openai/gpt-5-chat","choices":[{"delta":{"content":"hello"}}]}',
-        "data: [DONE]",
+        b'data: {"model":"openai/gpt-5-chat","choices":[{"delta":{"content":"hello"}}]}',
+        b"data: [DONE]",
     ]
 
     def _post(*args, **kwargs):
@@ -81,3 +81,79 @@ def test_does_not_retry_on_401(monkeypatch) -> None:
         client.chat([{"role": "user", "content": "hi"}])
 
     assert calls["n"] == 1
+
+
+def test_parses_utf8_sse_byte_lines(monkeypatch) -> None:
+    client = _client()
+    lines = [
+        b": keep-alive",
+        'data: {"choices":[{"delta":{"content":"Grüße "}}]}'.encode("utf-8"),
+        b"data: not-json",
+        'data: {"choices":[{"delta":{"content":"aus Köln"}}]}'.encode("utf-8"),
+        b"data: [DONE]",
+    ]
+
+    monkeypatch.setattr("llm.openrouter_client.requests.post", lambda *a, **k: FakeResponse(200, lines))
+
+    out = client.chat([{"role": "user", "content": "hi"}])
+
+    assert out["text"] == "Grüße aus Köln"
+
+
+@pytest.mark.parametrize(("status", "expected_calls"), [(408, 2), (503, 2), (522, 2), (501, 1), (505, 1)])
+def test_retries_only_transient_statuses(monkeypatch, status, expected_calls) -> None:
+    client = _client()
+    calls = {"n": 0}
+    success_lines = [b'data: {"choices":[{"delta":{"content":"ok"}}]}', b"data: [DONE]"]
+
+    def _post(*args, **kwargs):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return FakeResponse(status)
+        return FakeResponse(200, success_lines)
+
+    monkeypatch.setattr("llm.openrouter_client.requests.post", _post)
+    monkeypatch.setattr("llm.openrouter_client.time.sleep", lambda *_: None)
+
+    if expected_calls == 1:
+        with pytest.raises(requests.HTTPError):
+            client.chat([{"role": "user", "content": "hi"}])
+    else:
+        assert client.chat([{"role": "user", "content": "hi"}])["text"] == "ok"
+    assert calls["n"] == expected_calls
+
+
+def test_backoff_sleep_is_capped_by_deadline(monkeypatch) -> None:
+    client = _client()
+    client._retry_base_delay_s = 10.0
+    sleeps = []
+    monkeypatch.setattr("llm.openrouter_client.time.monotonic", lambda: 100.0)
+    monkeypatch.setattr("llm.openrouter_client.time.sleep", sleeps.append)
+
+    assert client._sleep_before_retry(0, deadline=100.5) is False
+    assert client._sleep_before_retry(1, deadline=99.0) is False
+    assert sleeps == []
+
+    client._retry_base_delay_s = 0.1
+    assert client._sleep_before_retry(0, deadline=101.0) is True
+    assert len(sleeps) == 1
+    assert 0.1 <= sleeps[0] <= 0.125
+
+
+def test_gives_up_once_deadline_has_passed(monkeypatch) -> None:
+    client = _client()
+    calls = {"n": 0}
+    clock = iter([0.0])  # t0; every later reading is past the 3s budget
+
+    def _post(*args, **kwargs):
+        calls["n"] += 1
+        return FakeResponse(503)
+
+    monkeypatch.setattr("llm.openrouter_client.requests.post", _post)
+    monkeypatch.setattr("llm.openrouter_client.time.monotonic", lambda: next(clock, 10.0))
+    monkeypatch.setattr("llm.openrouter_client.time.sleep", lambda *_: None)
+
+    with pytest.raises(requests.HTTPError):
+        client.chat([{"role": "user", "content": "hi"}])
+
+    assert calls["n"] == 1
@@ -0,0 +1,163 @@
+import importlib
+import sys
+import types
+
+import numpy as np
+import pytest
+
+
+class FakeChunk:
+    def __init__(self, audio):
+        self.audio_int16_array = audio
+
+
+class FakeVoice:
+    def __init__(self, config=None, session=None, path=None, config_path=None):
+        self.config = config or types.SimpleNamespace(sample_rate=100)
+        self.session = session
+        self.path = path
+        self.config_path = config_path
+        self.calls: list[str] = []
+
+    @classmethod
+    def load(cls, path, config_path=None):
+        return cls(path=path, config_path=config_path)
+
+    def synthesize(self, text, syn_config=None):
+        self.calls.append(text)
+        yield FakeChunk(np.full(len(text), 1000, dtype=np.int16))
+
+
+def _load_piper_tts_with_fake_piper(monkeypatch):
+    fake_voice_mod = types.ModuleType("piper.voice")
+    fake_voice_mod.PiperVoice = FakeVoice
+    fake_config_mod = types.ModuleType("piper.config")
+    fake_config_mod.SynthesisConfig = lambda **kwargs: types.SimpleNamespace(**kwargs)
+    fake_config_mod.PiperConfig = types.SimpleNamespace(
+        from_dict=lambda d: types.SimpleNamespace(sample_rate=d["audio"]["sample_rate"])
+    )
+    monkeypatch.setitem(sys.modules, "piper", types.ModuleType("piper"))
+    monkeypatch.setitem(sys.modules, "piper.voice", fake_voice_mod)
+    monkeypatch.setitem(sys.modules, "piper.config", fake_config_mod)
+    sys.modules.pop("tts.piper_tts", None)
+    return importlib.import_module("tts.piper_tts")
+
+
+def _tts(monkeypatch, tmp_path, **overrides):
+    piper_mod = _load_piper_tts_with_fake_piper(monkeypatch)
+    (tmp_path / "en-voice.onnx").touch()
+    config = {
+        "model_dir": str(tmp_path),
+        "default_language": "en",
+        "sentence_silence": 0.1,
+        "voices": {"en": {"piper_voice": "en-voice"}},
+        **overrides,
+    }
+    return piper_mod.PiperTTS(config)
+
+
+def test_repeated_sentences_are_served_from_cache(monkeypatch, tmp_path) -> None:
+    tts = _tts(monkeypatch, tmp_path)
+    voice = tts._voices["en"]
+
+    first, sr = tts.synthesize("Okay. One moment.")
+    second, _ = tts.synthesize("One moment. Okay.")
+
+    assert sr == 100
+    assert voice.calls == ["Okay.", "One moment."]
+    # Two sentences of audio with one 0.1s silence gap in between.
+    assert len(first) == len(second) == len("Okay.") + 10 + len("One moment.")
+    assert first.dtype == np.int16
+    assert first.flags.writeable
+
+
+def test_sentence_cache_can_be_disabled(monkeypatch, tmp_path) -> None:
+    tts = _tts(monkeypatch, tmp_path, sentence_cache_size=0)
+    voice = tts._voices["en"]
+
+    tts.synthesize("Okay.")
+    tts.synthesize("Okay.")
+
+    assert voice.calls == ["Okay.", "Okay."]
+
+
+def test_blank_text_skips_synthesis(monkeypatch, tmp_path) -> None:
+    tts = _tts(monkeypatch, tmp_path)
+
+    audio, sr = tts.synthesize("  \n ")
+
+    assert sr == 100
+    assert audio.size == 0
+    assert tts._voices["en"].calls == []
+
+
+def test_configured_providers_build_session_without_default_load(monkeypatch, tmp_path) -> None:
+    sessions = []
+    fake_ort = types.ModuleType("onnxruntime")
+    fake_ort.get_available_providers = lambda: ["CoreMLExecutionProvider", "CPUExecutionProvider"]
+    fake_ort.SessionOptions = lambda: "options"
+    fake_ort.InferenceSession = lambda path, sess_options, providers: sessions.append((path, providers)) or "session"
+    monkeypatch.setitem(sys.modules, "onnxruntime", fake_ort)
+    (tmp_path / "en-voice.onnx.json").write_text('{"audio": {"sample_rate": 22050}}')
+
+    tts = _tts(
+        monkeypatch,
+        tmp_path,
+        providers=["CUDAExecutionProvider", "CoreMLExecutionProvider", "CPUExecutionProvider"],
+    )
+    voice = tts._voices["en"]
+
+    # One session per voice, built directly with the available providers.
+    assert sessions == [(str(tmp_path / "en-voice.onnx"), ["CoreMLExecutionProvider", "CPUExecutionProvider"])]
+    assert voice.session == "session"
+    assert voice.path is None  # PiperVoice.load was not used
+    assert tts._sample_rates["en"] == 22050
+
+
+def test_prefer_int8_loads_quantized_model_with_fp32_config(monkeypatch, tmp_path) -> None:
+    (tmp_path / "en-voice.int8.onnx").touch()
+
+    tts = _tts(monkeypatch, tmp_path, prefer_int8=True)
+    voice = tts._voices["en"]
+
+    assert voice.path == str(tmp_path / "en-voice.int8.onnx")
+    assert voice.config_path == str(tmp_path / "en-voice.onnx.json")
+
+
+def test_prefer_int8_falls_back_to_fp32_model(monkeypatch, tmp_path) -> None:
+    tts = _tts(monkeypatch, tmp_path, prefer_int8=True)
+
+    assert tts._voices["en"].path == str(tmp_path / "en-voice.onnx")
+
+
+def test_ordinals_and_abbreviations_do_not_split_sentences(monkeypatch, tmp_path) -> None:
+    tts = _tts(monkeypatch, tmp_path)
+    text = "Das Konzert ist am 3. Oktober, z. B. mit Dr. Müller. Bis dann!"
+
+    tts.synthesize(text)
+
+    assert tts._voices["en"].calls == ["Das Konzert ist am 3. Oktober, z. B. mit Dr. Müller.", "Bis dann!"]
+
+
+@pytest.mark.parametrize(
+    ("text", "expected_calls"),
+    [
+        (". Hello there.", [". Hello there."]),
+        ("... hmm, let me think.", ["... hmm, let me think."]),
+        ("Okay. . Next", ["Okay.", ". Next"]),
+    ],
+)
+def test_punctuation_without_preceding_word_does_not_crash(monkeypatch, tmp_path, text, expected_calls) -> None:
+    tts = _tts(monkeypatch, tmp_path)
+
+    audio, _ = tts.synthesize(text)
+
+    assert audio.size
+    assert tts._voices["en"].calls == expected_calls
+
+
+@pytest.mark.parametrize("configured", [None, "bogus", -5])
+def test_invalid_sentence_cache_size_stays_bounded(monkeypatch, tmp_path, configured) -> None:
+    tts = _tts(monkeypatch, tmp_path, sentence_cache_size=configured)
+
+    assert tts._synthesize_sentence.cache_info().maxsize is not None
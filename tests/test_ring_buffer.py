@@ -0,0 +1,22 @@
+import numpy as np
+
+from audio.ring_buffer import RingBuffer
+
+
+def test_read_last_only_returns_written_samples() -> None:
+    buf = RingBuffer(max_seconds=1, sample_rate=8)
+
+    assert buf.read_last(8).size == 0
+    buf.write(np.array([1, 2, 3], dtype=np.int16))
+    assert buf.read_last(8).tolist() == [1, 2, 3]
+
+
+def test_clear_discards_previous_samples() -> None:
+    buf = RingBuffer(max_seconds=1, sample_rate=8)
+    buf.write(np.arange(1, 11, dtype=np.int16))  # Wraps around
+    assert buf.read_last(8).tolist() == [3, 4, 5, 6, 7, 8, 9, 10]
+
+    buf.clear()
+    buf.write(np.array([42], dtype=np.int16))
+
+    assert buf.read_last(8).tolist() == [42]
@@ -1,37 +1,37 @@
-import importlib
-import sys
 import time
-import types
+from types import MappingProxyType, SimpleNamespace
 
 import numpy as np
-
-
-def _load_state_machine_with_stubs(monkeypatch):
-    def _module(name: str, **attrs):
-        mod = types.ModuleType(name)
-        for key, value in attrs.items():
-            setattr(mod, key, value)
-        return mod
-
-    monkeypatch.setitem(sys.modules, "audio.capture", _module("audio.capture", AudioCapture=object))
-    monkeypatch.setitem(sys.modules, "audio.playback", _module("audio.playback", AudioPlayer=object))
-    monkeypatch.setitem(
-        sys.modules,
-        "audio.vad",
-        _module("audio.vad", VoiceActivityDetector=object, UtteranceDetector=object),
-    )
-    monkeypatch.setitem(
-        sys.modules,
-        "audio.earcon",
-        _module("audio.earcon", play_earcon=lambda *a, **k: None, play_named_earcon=lambda *a, **k: None),
-    )
-    monkeypatch.setitem(sys.modules, "wake.detector", _module("wake.detector", WakeWordDetector=object))
-    monkeypatch.setitem(sys.modules, "stt.whisper_stt", _module("stt.whisper_stt", WhisperSTT=object))
-    monkeypatch.setitem(sys.modules, "llm.openrouter_client", _module("llm.openrouter_client", OpenRouterClient=object))
-    monkeypatch.setitem(sys.modules, "tts", _module("tts", TTSEngine=object))
-
-    sys.modules.pop("assistant.state_machine", None)
-    return importlib.import_module("assistant.state_machine")
+import pytest
+
+# One 80ms capture frame of silence, shared read-only by every test.
+_SILENT_FRAME = np.zeros(1280, dtype=np.int16)
+_SILENT_FRAME.setflags(write=False)
+# Utterance handed to _process_utterance and audio returned by FakeTTS.
+_UTTERANCE_AUDIO = np.array([1, 2], dtype=np.int16)
+_UTTERANCE_AUDIO.setflags(write=False)
+_TTS_AUDIO = np.array([0, 3277], dtype=np.int16)
+_TTS_AUDIO.setflags(write=False)
+# Audio returned by FakeUtteranceDetector.get_audio().
+_DETECTED_AUDIO = np.array([1, 2, 3], dtype=np.int16)
+_DETECTED_AUDIO.setflags(write=False)
+
+# The state machine only reads these results, so fakes hand out read-only
+# views instead of copying per call.
+_DEFAULT_STT_RESULT = MappingProxyType({
+    "text": "hello",
+    "language": "en",
+    "duration_s": 0.5,
+    "transcription_time_s": 0.1,
+    "avg_logprob": -0.1,
+    "no_speech_prob": 0.01,
+})
+_DEFAULT_LLM_RESULT = MappingProxyType({
+    "text": "ok",
+    "model": "fake",
+    "elapsed_s": 0.2,
+    "ttft_s": 0.1,
+})
 
 
 class FakeCapture:
@@ -77,22 +77,25 @@ class FakePlayer:
 
 class FakeVAD:
     def __init__(self, speech_sequence=None, default=False):
-        self._speech_sequence = list(speech_sequence or [])
+        self._speech_sequence = tuple(speech_sequence or ())
+        self._index = 0
         self._default = default
 
     def is_speech(self, frame):
-        if self._speech_sequence:
-            return self._speech_sequence.pop(0)
+        if self._index < len(self._speech_sequence):
+            is_speech = self._speech_sequence[self._index]
+            self._index += 1
+            return is_speech
         return self._default
 
 
 class FakeUtteranceDetector:
-    def __init__(self):
+    def __init__(self, return_sequence=None):
         self.state = "waiting"
-        self._audio = np.array([1, 2, 3], dtype=np.int16)
         self.reset_calls = 0
         self.process_calls = 0
-        self.return_sequence = []
+        self._return_sequence = tuple(return_sequence or ())
+        self._index = 0
 
     def reset(self):
         self.reset_calls += 1
@@ -100,26 +103,32 @@ class FakeUtteranceDetector:
 
     def process(self, frame, is_speech):
         self.process_calls += 1
-        if self.return_sequence:
-            self.state = self.return_sequence.pop(0)
+        if self._index < len(self._return_sequence):
+            self.state = self._return_sequence[self._index]
+            self._index += 1
             return self.state
         if is_speech:
             self.state = "collecting"
         return self.state
 
     def get_audio(self):
-        return self._audio
+        return _DETECTED_AUDIO
 
 
 class FakeWakeDetector:
+    _NO_DETECTION = (False, 0.0)
+
     def __init__(self, detections=None):
-        self._detections = list(detections or [(False, 0.0)])
+        self._detections = tuple(detections or ())
+        self._index = 0
         self.reset_calls = 0
 
     def process(self, frame):
-        if self._detections:
-            return self._detections.pop(0)
-        return False, 0.0
+        if self._index < len(self._detections):
+            detection = self._detections[self._index]
+            self._index += 1
+            return detection
+        return self._NO_DETECTION
 
     def reset(self):
         self.reset_calls += 1
@@ -127,30 +136,18 @@ class FakeWakeDetector:
 
 class FakeSTT:
     def __init__(self, result=None, error=None):
-        self._result = result or {
-            "text": "hello",
-            "language": "en",
-            "duration_s": 0.5,
-            "transcription_time_s": 0.1,
-            "avg_logprob": -0.1,
-            "no_speech_prob": 0.01,
-        }
+        self._result = MappingProxyType(result) if result else _DEFAULT_STT_RESULT
         self._error = error
 
     def transcribe(self, audio, sample_rate):
         if self._error:
             raise self._error
-        return dict(self._result)
+        return self._result
 
 
 class FakeLLM:
     def __init__(self, result=None, error=None):
-        self._result = result or {
-            "text": "ok",
-            "model": "fake",
-            "elapsed_s": 0.2,
-            "ttft_s": 0.1,
-        }
+        self._result = MappingProxyType(result) if result else _DEFAULT_LLM_RESULT
         self._error = error
         self.warmup_calls = 0
 
@@ -160,7 +157,7 @@ class FakeLLM:
     def chat(self, messages):
         if self._error:
             raise self._error
-        return dict(self._result)
+        return self._result
 
 
 class FakeTTS:
@@ -170,7 +167,7 @@ class FakeTTS:
     def synthesize(self, text, language=None):
         if self._error:
             raise self._error
-        return np.array([0.0, 0.1], dtype=np.float32), 16000
+        return _TTS_AUDIO, 16000
 
 
 class FakeSession:
@@ -195,171 +192,166 @@ class FakeSession:
 class FakeMetrics:
     def __init__(self):
         self.events = []
+        self.names: set[str] = set()
 
     def log(self, event_type, **data):
         self.events.append((event_type, data))
+        self.names.add(event_type)
+
+
+# Shared, read-only config. Tests needing different settings pass their own
+# ``config=`` to machine_factory rather than mutating this one.
+_BASE_CONFIG = MappingProxyType({
+    "audio": MappingProxyType({
+        "sample_rate": 16000,
+        "capture_drop_report_s": 5.0,
+    }),
+    "vad": MappingProxyType({
+        "barge_in_enabled": True,
+        "barge_in_frames": 2,
+        "barge_in_grace_s": 0.0,
+        "follow_up_grace_s": 0.0,
+        "speech_onset_frames": 2,
+        "listening_timeout_s": 1.0,
+        "max_utterance_s": 10.0,
+    }),
+    "earcon": MappingProxyType({"volume": 0.3, "frequency": 880, "duration_s": 0.1}),
+    "stt": MappingProxyType({}),
+    "conversation": MappingProxyType({"follow_up_window_s": 3.0}),
+    "metrics": MappingProxyType({"log_transcripts": True, "log_llm_text": True}),
+})
+
+
+_FAKE_FACTORIES = {
+    "capture": FakeCapture,
+    "player": FakePlayer,
+    "vad": FakeVAD,
+    "utterance": FakeUtteranceDetector,
+    "wake": FakeWakeDetector,
+    "stt": FakeSTT,
+    "llm": FakeLLM,
+    "tts": FakeTTS,
+    "session": FakeSession,
+    "metrics": FakeMetrics,
+}
+
+
+@pytest.fixture
+def machine_factory(sm):
+    """Return ``build(**overrides)`` creating a machine plus its collaborators.
+
+    Only fakes not supplied in *overrides* are constructed. The result is a
+    namespace exposing ``machine`` and each fake by its override name.
+    """
+    def build(config=_BASE_CONFIG, **overrides):
+        fakes = {
+            name: overrides[name] if name in overrides else factory()
+            for name, factory in _FAKE_FACTORIES.items()
+        }
+        machine = sm.StateMachine(
+            config=config,
+            capture=fakes["capture"],
+            player=fakes["player"],
+            vad=fakes["vad"],
+            utterance_detector=fakes["utterance"],
+            wake_detector=fakes["wake"],
+            stt=fakes["stt"],
+            llm_client=fakes["llm"],
+            tts=fakes["tts"],
+            session=fakes["session"],
+            metrics=fakes["metrics"],
+        )
+        return SimpleNamespace(machine=machine, **fakes)
 
-
-def _base_config():
-    return {
-        "audio": {
-            "sample_rate": 16000,
-            "capture_drop_report_s": 5.0,
-        },
-        "vad": {
-            "barge_in_enabled": True,
-            "barge_in_frames": 2,
-            "barge_in_grace_s": 0.0,
-            "follow_up_grace_s": 0.0,
-            "speech_onset_frames": 2,
-            "listening_timeout_s": 1.0,
-            "max_utterance_s": 10.0,
-        },
-        "earcon": {"volume": 0.3, "frequency": 880, "duration_s": 0.1},
-        "stt": {},
-        "conversation": {"follow_up_window_s": 3.0},
-        "metrics": {"log_transcripts": True, "log_llm_text": True},
-    }
-
-
-def _build_machine(sm, **overrides):
-    capture = overrides.get("capture", FakeCapture())
-    player = overrides.get("player", FakePlayer())
-    vad = overrides.get("vad", FakeVAD())
-    utterance = overrides.get("utterance", FakeUtteranceDetector())
-    wake = overrides.get("wake", FakeWakeDetector())
-    stt = overrides.get("stt", FakeSTT())
-    llm = overrides.get("llm", FakeLLM())
-    tts = overrides.get("tts", FakeTTS())
-    session = overrides.get("session", FakeSession())
-    metrics = overrides.get("metrics", FakeMetrics())
-
-    machine = sm.StateMachine(
-        config=_base_config(),
-        capture=capture,
-        player=player,
-        vad=vad,
-        utterance_detector=utterance,
-        wake_detector=wake,
-        stt=stt,
-        llm_client=llm,
-        tts=tts,
-        session=session,
-        metrics=metrics,
-    )
-    return machine, capture, player, vad, utterance, wake, stt, llm, tts, session, metrics
+    return build
 
 
-def test_passive_to_listening_transition_on_wake(monkeypatch):
-    sm = _load_state_machine_with_stubs(monkeypatch)
-    wake = FakeWakeDetector(detections=[(True, 0.9)])
-    machine, _, _, _, utterance, wake, _, llm, _, _, metrics = _build_machine(sm, wake=wake)
+def test_passive_to_listening_transition_on_wake(sm, machine_factory):
+    m = machine_factory(wake=FakeWakeDetector(detections=[(True, 0.9)]))
 
-    machine._handle_passive(np.zeros(1280, dtype=np.int16))
+    m.machine._handle_passive(_SILENT_FRAME)
 
-    assert machine.state == sm.State.LISTENING
-    assert wake.reset_calls == 1
-    assert utterance.reset_calls == 1
-    assert llm.warmup_calls == 1
-    assert any(name == "wake_detected" for name, _ in metrics.events)
+    assert m.machine.state == sm.State.LISTENING
+    assert m.wake.reset_calls == 1
+    assert m.utterance.reset_calls == 1
+    assert m.llm.warmup_calls == 1
+    assert "wake_detected" in m.metrics.names
 
 
-def test_listening_soft_timeout_returns_passive(monkeypatch):
-    sm = _load_state_machine_with_stubs(monkeypatch)
-    machine, _, _, _, _, _, _, _, _, session, metrics = _build_machine(sm)
+def test_listening_soft_timeout_returns_passive(sm, machine_factory, monkeypatch):
+    m = machine_factory()
 
-    machine._state = sm.State.LISTENING
-    machine._listening_start_time = 10.0
+    m.machine._state = sm.State.LISTENING
+    m.machine._listening_start_time = 10.0
     monkeypatch.setattr(sm.time, "monotonic", lambda: 12.0)
 
-    machine._handle_listening(np.zeros(1280, dtype=np.int16))
+    m.machine._handle_listening(_SILENT_FRAME)
 
-    assert machine.state == sm.State.PASSIVE
-    assert session.clear_calls == 1
-    assert any(name == "listening_timeout" for name, _ in metrics.events)
+    assert m.machine.state == sm.State.PASSIVE
+    assert m.session.clear_calls == 1
+    assert "listening_timeout" in m.metrics.names
 
 
-def test_speaking_barge_in_transitions_to_listening(monkeypatch):
-    sm = _load_state_machine_with_stubs(monkeypatch)
-    vad = FakeVAD(speech_sequence=[True, True])
-    machine, _, player, _, utterance, _, _, _, _, _, metrics = _build_machine(sm, vad=vad)
+def test_speaking_barge_in_transitions_to_listening(sm, machine_factory):
+    m = machine_factory(vad=FakeVAD(speech_sequence=[True, True]))
 
-    machine._state = sm.State.SPEAKING
-    player._playing = True
-    machine._speaking_start_time = time.monotonic() - 2.0
+    m.machine._state = sm.State.SPEAKING
+    m.player._playing = True
+    m.machine._speaking_start_time = time.monotonic() - 2.0
 
-    frame = np.zeros(1280, dtype=np.int16)
-    machine._handle_speaking(frame)
-    machine._handle_speaking(frame)
+    m.machine._handle_speaking(_SILENT_FRAME)
+    m.machine._handle_speaking(_SILENT_FRAME)
 
-    assert player.stop_calls == 1
-    assert utterance.reset_calls == 1
-    assert machine.state == sm.State.LISTENING
-    assert any(name == "barge_in" for name, _ in metrics.events)
+    assert m.player.stop_calls == 1
+    assert m.utterance.reset_calls == 1
+    assert m.machine.state == sm.State.LISTENING
+    assert "barge_in" in m.metrics.names
 
 
-def test_follow_up_timeout_returns_passive(monkeypatch):
-    sm = _load_state_machine_with_stubs(monkeypatch)
-    machine, _, _, _, _, _, _, _, _, session, _ = _build_machine(sm)
+def test_follow_up_timeout_returns_passive(sm, machine_factory, monkeypatch):
+    m = machine_factory()
 
-    machine._state = sm.State.FOLLOW_UP
-    machine._follow_up_deadline = 3.0
+    m.machine._state = sm.State.FOLLOW_UP
+    m.machine._follow_up_deadline = 3.0
     monkeypatch.setattr(sm.time, "monotonic", lambda: 5.0)
 
-    machine._check_follow_up_timeout()
+    m.machine._check_follow_up_timeout()
 
-    assert machine.state == sm.State.PASSIVE
-    assert session.clear_calls == 1
+    assert m.machine.state == sm.State.PASSIVE
+    assert m.session.clear_calls == 1
 
 
-def test_capture_drop_reporting_logs_metric(monkeypatch):
-    sm = _load_state_machine_with_stubs(monkeypatch)
+def test_capture_drop_reporting_logs_metric(machine_factory):
     capture = FakeCapture()
     capture._drops = 7
-    machine, _, _, _, _, _, _, _, _, _, metrics = _build_machine(sm, capture=capture)
-
-    machine._report_capture_drops(100.0)
-
-    assert any(name == "audio_frame_drop" and data.get("dropped_frames") == 7 for name, data in metrics.events)
-
-
-def test_stt_failure_enters_follow_up(monkeypatch):
-    sm = _load_state_machine_with_stubs(monkeypatch)
-    machine, _, _, _, _, _, _, _, _, _, metrics = _build_machine(sm, stt=FakeSTT(error=RuntimeError("stt failed")))
-
-    machine._state = sm.State.THINKING
-    machine._process_utterance(np.array([1, 2], dtype=np.int16))
-
-    assert machine.state == sm.State.FOLLOW_UP
-    assert any(name == "pipeline_error" for name, _ in metrics.events)
-
-
-def test_llm_failure_enters_follow_up(monkeypatch):
-    sm = _load_state_machine_with_stubs(monkeypatch)
-    machine, _, _, _, _, _, _, _, _, session, metrics = _build_machine(sm, llm=FakeLLM(error=RuntimeError("llm failed")))
+    m = machine_factory(capture=capture)
 
-    machine._state = sm.State.THINKING
-    machine._process_utterance(np.array([1, 2], dtype=np.int16))
+    m.machine._report_capture_drops(100.0)
 
-    assert machine.state == sm.State.FOLLOW_UP
-    assert len(session.history) == 1
-    assert any(name == "pipeline_error" for name, _ in metrics.events)
+    assert any(name == "audio_frame_drop" and data.get("dropped_frames") == 7 for name, data in m.metrics.events)
 
 
-def test_tts_failure_enters_follow_up(monkeypatch):
-    sm = _load_state_machine_with_stubs(monkeypatch)
-    machine, _, _, _, _, _, _, _, _, session, metrics = _build_machine(sm, tts=FakeTTS(error=RuntimeError("tts failed")))
+@pytest.mark.parametrize(
+    ("stage", "history_len"),
+    [
+        ("stt", 0),  # Fails before the transcript is recorded
+        ("llm", 1),  # User turn recorded, no assistant reply
+        ("tts", 2),  # Both turns recorded before synthesis fails
+    ],
+)
+def test_pipeline_stage_failure_enters_follow_up(sm, machine_factory, stage, history_len):
+    failing = {"stt": FakeSTT, "llm": FakeLLM, "tts": FakeTTS}[stage](error=RuntimeError(f"{stage} failed"))
+    m = machine_factory(**{stage: failing})
 
-    machine._state = sm.State.THINKING
-    machine._process_utterance(np.array([1, 2], dtype=np.int16))
+    m.machine._state = sm.State.THINKING
+    m.machine._process_utterance(_UTTERANCE_AUDIO)
 
-    assert machine.state == sm.State.FOLLOW_UP
-    assert len(session.history) == 2
-    assert any(name == "pipeline_error" for name, _ in metrics.events)
+    assert m.machine.state == sm.State.FOLLOW_UP
+    assert len(m.session.history) == history_len
+    assert "pipeline_error" in m.metrics.names
 
 
-def test_llm_response_is_sanitized_before_session_and_metrics(monkeypatch):
-    sm = _load_state_machine_with_stubs(monkeypatch)
+def test_llm_response_is_sanitized_before_session_and_metrics(sm, machine_factory):
     llm = FakeLLM(
         result={
             "text": "Das ist die Antwort【1†source】.\n\nQuellen:\n[1] https://example.com",
@@ -368,18 +360,18 @@ def test_llm_response_is_sanitized_before_session_and_metrics(monkeypatch):
             "ttft_s": 0.1,
         }
     )
-    machine, _, _, _, _, _, _, _, _, session, metrics = _build_machine(sm, llm=llm)
+    m = machine_factory(llm=llm)
 
-    machine._state = sm.State.THINKING
-    machine._process_utterance(np.array([1, 2], dtype=np.int16))
+    m.machine._state = sm.State.THINKING
+    m.machine._process_utterance(_UTTERANCE_AUDIO)
 
-    assert machine.state == sm.State.SPEAKING
-    assert session.history[-1]["role"] == "assistant"
-    assert "Quellen" not in session.history[-1]["content"]
-    assert "https://" not in session.history[-1]["content"]
+    assert m.machine.state == sm.State.SPEAKING
+    assert m.session.history[-1]["role"] == "assistant"
+    assert "Quellen" not in m.session.history[-1]["content"]
+    assert "https://" not in m.session.history[-1]["content"]
 
-    llm_complete = [data for name, data in metrics.events if name == "llm_complete"]
+    llm_complete = [data for name, data in m.metrics.events if name == "llm_complete"]
     assert llm_complete
     assert "Quellen" not in llm_complete[-1].get("text", "")
     assert "https://" not in llm_complete[-1].get("text", "")
-    assert any(name == "llm_response_sanitized" for name, _ in metrics.events)
+    assert "llm_response_sanitized" in m.metrics.names
@@ -0,0 +1,29 @@
+import importlib
+import sys
+import types
+
+import numpy as np
+
+
+class FakeVad:
+    def __init__(self, aggressiveness):
+        self.chunks: list[bytes] = []
+
+    def is_speech(self, buf, sample_rate):
+        self.chunks.append(bytes(buf))
+        return False
+
+
+def test_subframes_passed_to_webrtc_match_frame_bytes(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "webrtcvad", types.SimpleNamespace(Vad=FakeVad))
+    sys.modules.pop("audio.vad", None)
+    vad_mod = importlib.import_module("audio.vad")
+    vad = vad_mod.VoiceActivityDetector(
+        {"frame_duration_ms": 20, "aggressiveness": 3, "energy_threshold": 0}, sample_rate=16000,
+    )
+    frame = (np.arange(1280, dtype=np.int16) * 7)
+
+    assert vad.is_speech(frame) is False
+
+    raw = frame.tobytes()
+    assert vad._vad.chunks == [raw[i:i + 640] for i in range(0, len(raw), 640)]
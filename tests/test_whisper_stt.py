@@ -0,0 +1,49 @@
+import importlib
+import sys
+import types
+
+import numpy as np
+
+
+class FakeWhisperModel:
+    def __init__(self, *args, **kwargs):
+        self.last_audio = None
+
+    def transcribe(self, audio, **kwargs):
+        self.last_audio = audio
+        segment = types.SimpleNamespace(text=" hello ", avg_logprob=-0.2, no_speech_prob=0.1)
+        return iter([segment]), types.SimpleNamespace(language="en")
+
+
+def _stt(monkeypatch):
+    fake_fw = types.SimpleNamespace(WhisperModel=FakeWhisperModel)
+    monkeypatch.setitem(sys.modules, "faster_whisper", fake_fw)
+    sys.modules.pop("stt.whisper_stt", None)
+    stt_mod = importlib.import_module("stt.whisper_stt")
+    return stt_mod.WhisperSTT({"model_size": "tiny", "device": "cpu", "compute_type": "int8"})
+
+
+def test_bytes_and_array_inputs_produce_same_model_input(monkeypatch) -> None:
+    stt = _stt(monkeypatch)
+    audio = np.array([0, 16384, -32768, 32767], dtype=np.int16)
+
+    from_array = stt.transcribe(audio)
+    array_input = stt._model.last_audio
+    from_bytes = stt.transcribe(memoryview(audio.tobytes()))
+    bytes_input = stt._model.last_audio
+
+    assert array_input.dtype == np.float32
+    np.testing.assert_array_equal(array_input, bytes_input)
+    np.testing.assert_allclose(array_input, audio.astype(np.float32) / 32768.0)
+    assert from_array["text"] == from_bytes["text"] == "hello"
+    assert from_bytes["duration_s"] == 4 / 16000
+
+
+def test_odd_length_bytes_drop_the_trailing_partial_sample(monkeypatch) -> None:
+    stt = _stt(monkeypatch)
+    audio = np.array([100, -200, 300], dtype=np.int16)
+
+    result = stt.transcribe(audio.tobytes() + b"\x01")
+
+    np.testing.assert_array_equal(stt._model.last_audio, audio.astype(np.float32) / 32768.0)
+    assert result["duration_s"] == 3 / 16000
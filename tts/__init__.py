@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Protocol, runtime_checkable
+import importlib
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
-import numpy as np
+if TYPE_CHECKING:
+    import numpy as np
 
 
 @runtime_checkable
@@ -20,24 +22,26 @@ class TTSEngine(Protocol):
                 the matching voice. Falls back to the configured default when
                 *None* or when the language has no voice.
 
-        Returns ``(audio_float32, sample_rate)``.
+        Returns ``(audio_int16, sample_rate)``. 16-bit PCM is what both
+        backends produce natively and what the output device plays, so
+        nothing is widened to float on the way to the speaker.
         """
         ...
 
 
+# engine name -> (module, class). Modules are imported on first use so only
+# the selected backend's dependencies are loaded.
+_BACKENDS: dict[str, tuple[str, str]] = {
+    "piper": ("tts.piper_tts", "PiperTTS"),
+    "say": ("tts.mac_say", "MacTTS"),
+}
+
+
 def create_tts(tts_config: dict) -> TTSEngine:
     """Instantiate the TTS engine specified by ``tts_config["engine"]``.
 
-    Falls back to macOS ``say`` when the key is absent or set to ``"say"``.
+    Falls back to macOS ``say`` when the key is absent or unknown.
     """
-    engine = tts_config.get("engine", "say")
-
-    if engine == "piper":
-        from tts.piper_tts import PiperTTS
-
-        return PiperTTS(tts_config)
-
-    # Default: macOS say
-    from tts.mac_say import MacTTS
-
-    return MacTTS(tts_config)
+    module_name, class_name = _BACKENDS.get(tts_config.get("engine", "say"), _BACKENDS["say"])
+    engine_cls = getattr(importlib.import_module(module_name), class_name)
+    return engine_cls(tts_config)
@@ -1,18 +1,21 @@
 """Text-to-speech using macOS `say` command."""
 
+import os
 import subprocess
 import tempfile
+import weakref
 from pathlib import Path
 
 import numpy as np
-import soundfile as sf
 
 
 class MacTTS:
     """Synthesizes speech via macOS `say -o` → AIFF file → numpy array.
 
     Writing to a temp file then reading it back lets us use sounddevice for
-    playback, which supports instant stop() for barge-in.
+    playback, which supports instant stop() for barge-in. One temp file is
+    created per engine and overwritten by each call; it is removed when the
+    engine is garbage-collected or the interpreter exits.
     """
 
     def __init__(self, tts_config: dict):
@@ -31,39 +34,48 @@ class MacTTS:
         else:
             # Backward compat: flat voice key
             self._voice_map[self._default_language] = tts_config["voice"]
+        if self._default_language not in self._voice_map:
+            raise ValueError(
+                f"No macOS voice for default language '{self._default_language}': "
+                f"set tts.voices.{self._default_language}.say_voice in config.yaml"
+            )
+        self._default_voice = self._voice_map[self._default_language]
+
+        fd, self._tmp_path = tempfile.mkstemp(suffix=".aiff")
+        os.close(fd)
+        weakref.finalize(self, Path(self._tmp_path).unlink, missing_ok=True)
 
     def synthesize(self, text: str, language: str | None = None) -> tuple[np.ndarray, int]:
         """Convert text to audio using the voice for *language*.
 
-        Returns (audio_float32, sample_rate).
+        Returns (audio_int16, sample_rate).
         """
-        lang = language if language and language in self._voice_map else self._default_language
-        voice = self._voice_map[lang]
-
-        with tempfile.NamedTemporaryFile(suffix=".aiff", delete=False) as f:
-            tmp_path = f.name
-
-        try:
-            subprocess.run(
-                [
-                    "say",
-                    "-v", voice,
-                    "-r", str(self._rate),
-                    "-o", tmp_path,
-                    text,
-                ],
-                check=True,
-                capture_output=True,
-                timeout=30,
-            )
+        voice = self._voice_map.get(language, self._default_voice)
+
+        if not text.strip():
+            return np.array([], dtype=np.int16), self._output_sample_rate
+
+        subprocess.run(
+            [
+                "say",
+                "-v", voice,
+                "-r", str(self._rate),
+                "-o", self._tmp_path,
+                text,
+            ],
+            check=True,
+            # say -o prints nothing useful on stdout; keep stderr for errors.
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=30,
+        )
 
-            audio, sr = sf.read(tmp_path, dtype="float32")
+        import soundfile as sf
 
-            # Ensure mono
-            if audio.ndim > 1:
-                audio = audio[:, 0]
+        audio, sr = sf.read(self._tmp_path, dtype="int16")
 
-            return audio, sr
+        # Ensure mono
+        if audio.ndim > 1:
+            audio = audio[:, 0]
 
-        finally:
-            Path(tmp_path).unlink(missing_ok=True)
+        return audio, sr
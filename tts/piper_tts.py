@@ -1,13 +1,71 @@
 """Text-to-speech using Piper (local neural TTS)."""
 
+from __future__ import annotations
+
+import functools
+import json
 import logging
+import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
-from piper.voice import PiperVoice
+
+if TYPE_CHECKING:
+    from piper.voice import PiperVoice
 
 log = logging.getLogger(__name__)
 
+# Candidate sentence ends: terminal punctuation followed by whitespace.
+_SENTENCE_END_RE = re.compile(r"[.!?]+\s+")
+# Dotted words of four or more letters that still do not end a sentence.
+_ABBREVIATIONS = frozenset({"bspw", "evtl", "ggfs", "inkl", "prof", "zzgl"})
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Split *text* into cacheable units at unambiguous sentence ends.
+
+    A period only counts when it follows a word of at least four letters that
+    is not a known abbreviation, so ordinals ("am 3. Oktober") and short
+    abbreviations ("z. B.", "Dr.") stay with their sentence. Erring towards
+    fewer splits is safe: Piper still splits each unit into sentences itself.
+    """
+    sentences: list[str] = []
+    start = 0
+    for match in _SENTENCE_END_RE.finditer(text):
+        words = text[start:match.start()].split()
+        if not words:
+            # Punctuation with nothing before it (". Hello", "Okay. . Next").
+            continue
+        if match.group().rstrip().endswith("."):
+            word = words[-1].lstrip("(\"'")
+            if len(word) < 4 or not word.isalpha() or word.lower() in _ABBREVIATIONS:
+                continue
+        sentences.append(text[start:match.start() + len(match.group().rstrip())])
+        start = match.end()
+    sentences.append(text[start:])
+    return sentences
+
+
+def _join_with_silence(arrays: list[np.ndarray], silence: np.ndarray) -> np.ndarray:
+    """Concatenate *arrays* with *silence* between them into one new buffer.
+
+    The output is sized up front and filled by slice assignment, so no
+    interleaved list of silence references is built.
+    """
+    if not arrays:
+        return np.array([], dtype=silence.dtype)
+    gap = silence.size
+    out = np.empty(sum(a.size for a in arrays) + gap * (len(arrays) - 1), dtype=silence.dtype)
+    pos = 0
+    for i, audio in enumerate(arrays):
+        if i:
+            out[pos:pos + gap] = silence
+            pos += gap
+        out[pos:pos + audio.size] = audio
+        pos += audio.size
+    return out
+
 
 class PiperTTS:
     """Synthesizes speech via local Piper ONNX voice models.
@@ -15,15 +73,25 @@ class PiperTTS:
     When ``voices`` is present in the config, one model per language is loaded
     at init time.  ``synthesize()`` selects the voice matching the requested
     language, falling back to ``default_language``.
+
+    Synthesized audio is memoized per ``(language, sentence)`` so short
+    phrases that recur across responses skip the ONNX forward pass.
     """
 
     def __init__(self, tts_config: dict):
+        # Imported here so loading this module (e.g. for the factory) does not
+        # pull in piper and onnxruntime until an engine is actually built.
+        from piper.config import SynthesisConfig
+
         model_dir = Path(tts_config.get("model_dir", "models/piper"))
         self._sentence_silence = tts_config.get("sentence_silence", 0.2)
         self._length_scale = tts_config.get("length_scale")
         self._noise_scale = tts_config.get("noise_scale")
         self._noise_w_scale = tts_config.get("noise_w_scale")
 
+        self._providers = list(tts_config.get("providers") or [])
+        self._prefer_int8 = tts_config.get("prefer_int8", False)
+
         self._default_language = tts_config.get("default_language", "en")
         self._voices: dict[str, PiperVoice] = {}
         self._sample_rates: dict[str, int] = {}
@@ -38,7 +106,7 @@ class PiperTTS:
                 if not model_path.exists():
                     log.warning("Piper voice model not found for '%s': %s — skipping", lang, model_path)
                     continue
-                voice = PiperVoice.load(str(model_path))
+                voice = self._load_voice(model_path)
                 self._voices[lang] = voice
                 self._sample_rates[lang] = voice.config.sample_rate
                 log.info("Loaded Piper voice for '%s': %s", lang, voice_name)
@@ -51,38 +119,119 @@ class PiperTTS:
                     f"Piper voice model not found: {model_path}\n"
                     "Download it from: https://huggingface.co/rhasspy/piper-voices"
                 )
-            voice = PiperVoice.load(str(model_path))
+            voice = self._load_voice(model_path)
             self._voices[self._default_language] = voice
             self._sample_rates[self._default_language] = voice.config.sample_rate
 
         if not self._voices:
             raise FileNotFoundError("No Piper voice models could be loaded")
 
-    def synthesize(self, text: str, language: str | None = None) -> tuple[np.ndarray, int]:
-        """Convert *text* to audio using the voice for *language*.
+        # Inter-sentence silence per language, allocated once and shared read-only.
+        self._silence: dict[str, np.ndarray] = {}
+        for lang, sample_rate in self._sample_rates.items():
+            silence = np.zeros(int(self._sentence_silence * sample_rate), dtype=np.int16)
+            silence.setflags(write=False)
+            self._silence[lang] = silence
 
-        Returns ``(audio_float32, sample_rate)``.
-        """
-        from piper.config import SynthesisConfig
-
-        lang = language if language and language in self._voices else self._default_language
-        voice = self._voices[lang]
-        sample_rate = self._sample_rates[lang]
-
-        syn_config = SynthesisConfig(
+        # Synthesis parameters are fixed per instance, so one config is shared
+        # by every call and (language, sentence) fully determines the audio.
+        self._syn_config = SynthesisConfig(
             length_scale=self._length_scale,
             noise_scale=self._noise_scale,
             noise_w_scale=self._noise_w_scale,
         )
+        try:
+            cache_size = int(tts_config.get("sentence_cache_size", 256))
+        except (TypeError, ValueError):
+            cache_size = 256
+        # Always bounded: maxsize=None would make lru_cache grow without limit.
+        cache_size = max(0, cache_size)
+        self._synthesize_sentence = functools.lru_cache(maxsize=cache_size)(
+            self._synthesize_sentence_uncached
+        )
+
+    def _load_voice(self, model_path: Path) -> PiperVoice:
+        """Load a voice, moving it onto the configured ORT providers if any.
+
+        With ``prefer_int8``, a quantized ``<voice>.int8.onnx`` next to the
+        FP32 model is used when present; it shares the FP32 model's JSON config.
+
+        When ``providers`` is set, the ONNX session is created directly with
+        the subset of those providers this onnxruntime build actually offers,
+        in config order. Otherwise (or if none is available) ``PiperVoice.load``
+        builds its default CPU session.
+        """
+        from piper.voice import PiperVoice
+
+        config_path = f"{model_path}.json"
+        if self._prefer_int8:
+            int8_path = model_path.with_suffix(".int8.onnx")
+            if int8_path.exists():
+                model_path = int8_path
+            else:
+                log.info("No int8 Piper model at %s — using %s", int8_path, model_path.name)
+
+        providers = self._available_providers()
+        if not providers:
+            return PiperVoice.load(str(model_path), config_path=config_path)
+
+        import onnxruntime
+        from piper.config import PiperConfig
+
+        with open(config_path, encoding="utf-8") as f:
+            config = PiperConfig.from_dict(json.load(f))
+        session = onnxruntime.InferenceSession(
+            str(model_path), sess_options=onnxruntime.SessionOptions(), providers=providers
+        )
+        log.info("Piper voice %s using ONNX providers %s", model_path.name, providers)
+        return PiperVoice(config=config, session=session)
+
+    def _available_providers(self) -> list[str]:
+        """Configured ORT providers that this onnxruntime build offers, in order."""
+        if not self._providers:
+            return []
+
+        import onnxruntime
 
-        silence_samples = int(self._sentence_silence * sample_rate)
-        silence = np.zeros(silence_samples, dtype=np.float32)
+        available = set(onnxruntime.get_available_providers())
+        providers = [p for p in self._providers if p in available]
+        if not providers:
+            log.warning("None of the configured ONNX providers are available: %s", self._providers)
+        return providers
+
+    def synthesize(self, text: str, language: str | None = None) -> tuple[np.ndarray, int]:
+        """Convert *text* to audio using the voice for *language*.
+
+        Returns ``(audio_int16, sample_rate)``.
+        """
+        lang = language if language in self._voices else self._default_language
+        sample_rate = self._sample_rates[lang]
+        silence = self._silence[lang]
+
+        text = text.strip()
+        if not text:
+            return np.array([], dtype=np.int16), sample_rate
 
         arrays: list[np.ndarray] = []
-        for chunk in voice.synthesize(text, syn_config=syn_config):
-            if arrays:
-                arrays.append(silence)
-            arrays.append(chunk.audio_float_array)
+        for sentence in _split_sentences(text):
+            if not sentence:
+                continue
+            audio = self._synthesize_sentence(lang, sentence)
+            if audio.size:
+                arrays.append(audio)
 
-        audio = np.concatenate(arrays) if arrays else np.array([], dtype=np.float32)
-        return audio, sample_rate
+        return _join_with_silence(arrays, silence), sample_rate
+
+    def _synthesize_sentence_uncached(self, lang: str, sentence: str) -> np.ndarray:
+        """Run Piper on a single sentence. Wrapped by an LRU cache in ``__init__``."""
+        voice = self._voices[lang]
+        silence = self._silence[lang]
+
+        arrays = [
+            chunk.audio_int16_array
+            for chunk in voice.synthesize(sentence, syn_config=self._syn_config)
+        ]
+        audio = _join_with_silence(arrays, silence)
+        # Cached arrays are shared between calls — guard against mutation.
+        audio.setflags(write=False)
+        return audio